@@ -0,0 +1,61 @@
+'''
+Fixed radius edge construction benchmark: KD-tree engine against the old
+Python double loop over all node pairs.
+
+The points are uniform in a square of side sqrt(N), so with the default radius
+every node has about the same expected degree for all N. The double loop is
+only run up to --max-loop-n nodes and its edge set is checked against the
+KD-tree one.
+
+Usage (from the repository root):
+    python benchmarks/bench_fixed_radius.py [--sizes 1000 10000 100000 1000000] [--radius 2]
+'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tcgre.spatial import fixed_radius_edges
+
+
+# the edge construction of add_edges_by_fixed_radius before the KD-tree, without the prints
+def double_loop_edges(points, radius):
+    edges = []
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            if np.sqrt((points[i][0] - points[j][0])**2 + (points[i][1] - points[j][1])**2) < radius:
+                edges.append((i, j))
+    return edges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--radius', type=float, default=2.0)
+    parser.add_argument('--max-loop-n', type=int, default=2_000, help='largest N timed with the double loop')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'N':>10} {'edges':>12} {'kdtree (s)':>12} {'loop (s)':>12}")
+    for n in args.sizes:
+        points = rng.random((n, 2)) * np.sqrt(n)
+
+        start = time.perf_counter()
+        edges = fixed_radius_edges(points, args.radius)
+        kdtree_time = time.perf_counter() - start
+
+        loop_time = ''
+        if n <= args.max_loop_n:
+            start = time.perf_counter()
+            loop_edges = double_loop_edges(points.tolist(), args.radius)
+            loop_time = f"{time.perf_counter() - start:12.3f}"
+            assert set(loop_edges) == set(map(tuple, edges.tolist())), "edge sets differ"
+        print(f"{n:>10} {len(edges):>12} {kdtree_time:>12.3f} {loop_time:>12}")
+
+
+if __name__ == '__main__':
+    main()
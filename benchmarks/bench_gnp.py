@@ -0,0 +1,77 @@
+'''
+G(n, p) edge sampling benchmark: geometric skip sampler against
+nx.erdos_renyi_graph, which tests all the n(n-1)/2 pairs.
+
+p is set to --degree / n, so the graphs have about the same average degree for
+all n. networkx is only run up to --max-nx-n nodes. Before the timings, the
+frequency of every pair over many small samples is checked against p for both
+samplers, and the skip sampler is timed with and without building the networkx
+graph from its edge array.
+
+Usage (from the repository root):
+    python benchmarks/bench_gnp.py [--sizes 1000 10000 100000 1000000] [--degree 10]
+'''
+import argparse
+import os
+import sys
+import time
+
+import networkx as nx
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tcgre.erdos_renyi import ErdosRenyi_GNP_Graph_Generator
+from tcgre.sampling import num_pairs
+
+
+# largest deviation of the frequency of a pair from p over repeats small samples
+def pair_frequency_error(method, n, p, repeats, seed):
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((n, n))
+    for _ in range(repeats):
+        G = ErdosRenyi_GNP_Graph_Generator(n, p, seed=rng, method=method).create_gnp_random_graph()
+        for u, v in G.edges():
+            counts[min(u, v), max(u, v)] += 1
+    return np.abs(counts[np.triu_indices(n, 1)] / repeats - p).max()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--degree', type=float, default=10.0, help='expected average degree, p = degree / n')
+    parser.add_argument('--max-nx-n', type=int, default=10_000, help='largest n timed with networkx')
+    parser.add_argument('--repeats', type=int, default=20_000, help='samples of the pair frequency check')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # both samplers keep every pair with probability p
+    n, p = 8, 0.3
+    tolerance = 5 * np.sqrt(p * (1 - p) / args.repeats)
+    for method in ('skip', 'networkx'):
+        error = pair_frequency_error(method, n, p, args.repeats, args.seed)
+        print(f"{method:>8} G({n}, {p}) largest pair frequency error {error:.4f} (tolerance {tolerance:.4f})")
+        assert error < tolerance, f"{method} pair frequencies differ from p"
+    print()
+
+    print(f"{'n':>10} {'edges':>10} {'expected':>10} {'skip (s)':>10} {'skip+nx (s)':>12} {'networkx (s)':>13}")
+    for n in args.sizes:
+        p = min(args.degree / n, 1.0)
+
+        start = time.perf_counter()
+        edges = ErdosRenyi_GNP_Graph_Generator(n, p, seed=args.seed, method='skip').generate_gnp_edges()
+        skip_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ErdosRenyi_GNP_Graph_Generator(n, p, seed=args.seed, method='skip').create_gnp_random_graph()
+        graph_time = time.perf_counter() - start
+
+        nx_time = ''
+        if n <= args.max_nx_n:
+            start = time.perf_counter()
+            nx.erdos_renyi_graph(n, p, seed=args.seed)
+            nx_time = f"{time.perf_counter() - start:13.3f}"
+        print(f"{n:>10} {len(edges):>10} {num_pairs(n) * p:>10.0f} {skip_time:>10.3f} {graph_time:>12.3f} {nx_time:>13}")
+
+
+if __name__ == '__main__':
+    main()
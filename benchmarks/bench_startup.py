@@ -0,0 +1,61 @@
+'''
+Startup benchmark: time to import the generators in a fresh interpreter.
+
+Every measurement runs in a new python process, so nothing is cached in
+sys.modules. It also checks that importing the generators does not load
+matplotlib, and compares it with importing matplotlib.pyplot on top.
+
+Usage (from the repository root):
+    python benchmarks/bench_startup.py [--repeat 10]
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_GENERATORS = "import tcgre"
+IMPORT_WITH_PYPLOT = "import tcgre; import matplotlib; matplotlib.use('Agg'); import matplotlib.pyplot"
+
+# time a statement in a fresh interpreter, returns seconds and whether matplotlib was loaded
+TIMER = '''
+import sys, time
+start = time.perf_counter()
+exec({stmt!r})
+elapsed = time.perf_counter() - start
+print(elapsed, 'matplotlib' in sys.modules)
+'''
+
+
+def time_import(stmt):
+    output = subprocess.run([sys.executable, '-c', TIMER.format(stmt=stmt)], cwd=ROOT,
+                            check=True, capture_output=True, text=True).stdout.split()
+    return float(output[0]), output[1] == 'True'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='number of fresh interpreters per measurement')
+    args = parser.parse_args()
+
+    results = {}
+    for label, stmt in [('import tcgre', IMPORT_GENERATORS), ('import tcgre + pyplot', IMPORT_WITH_PYPLOT)]:
+        timings, loaded = [], set()
+        for _ in range(args.repeat):
+            elapsed, matplotlib_loaded = time_import(stmt)
+            timings.append(elapsed)
+            loaded.add(matplotlib_loaded)
+        results[label] = (statistics.median(timings), loaded)
+        print(f"{label:<24} median {statistics.median(timings) * 1000:8.1f} ms   min {min(timings) * 1000:8.1f} ms   matplotlib loaded: {loaded == {True}}")
+
+    if results['import tcgre'][1] != {False}:
+        print("FAIL: importing tcgre loaded matplotlib")
+        return 1
+    print("OK: importing tcgre does not load matplotlib")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
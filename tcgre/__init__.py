@@ -0,0 +1,21 @@
+import logging
+
+from .base import TCGRE_Graph_Generator
+from .instance import TCGRE_Instance
+from .instance_file import save_instance, load_instance
+from .registry import GENERATORS, register_generator, get_generator, create_generator
+
+# importing the families registers their TCGRE generators
+from .erdos_renyi import TCGRE_ErdosRenyi_GNP_Graph_Generator, TCGRE_ErdosRenyi_GNM_Graph_Generator
+from .grid_style import TCGRE_GridStyle_Graph_Generator
+from .nearest_neighbor import TCGRE_NN_FixedRadius_Graph_Generator, TCGRE_NN_Percentage_Graph_Generator
+from .random_connection import TCGRE_RC_Graph_Generator
+from .voronoi_diagram import TCGRE_VD_Graph_Generator
+
+from .batch import generate_batch, generate_instance, iter_batch
+from .jsonl import write_jsonl, read_jsonl
+from .corpus import TCGRE_Corpus, append_batch
+from .cache import TCGRE_Cache
+
+# the generators log their progress, nothing is shown unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
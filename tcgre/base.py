@@ -0,0 +1,282 @@
+import logging
+import time
+from itertools import chain
+
+import networkx as nx
+import numpy as np
+
+from .instance import TCGRE_Instance
+from .spatial import pair_keys
+
+logger = logging.getLogger(__name__)
+
+
+# seed as a plain JSON value: an int, the entropy and spawn key of a SeedSequence, or None for
+# a Generator or no seed, which cannot be written down
+def describe_seed(seed):
+    if isinstance(seed, np.random.SeedSequence):
+        # a numpy int root seed stays a numpy int in the entropy, which JSON cannot encode
+        entropy = seed.entropy
+        entropy = [int(value) for value in entropy] if isinstance(entropy, (list, tuple, np.ndarray)) else int(entropy)
+        return {'entropy': entropy, 'spawn_key': [int(key) for key in seed.spawn_key]}
+    if isinstance(seed, (int, np.integer)):
+        return int(seed)
+    return None
+
+
+class TCGRE_Graph_Generator:
+    '''
+    Shared TCGRE steps for every graph family:
+    1) Create the base graph (implemented by each family in create_graph).
+    2) Pick risk edges, with at least one of them on a shortest path between source and target.
+    3) Pick one neighbour of every risk edge as its support node.
+    4) Add cost to the edges: risk edges get [risk_cost, (support_node,)], normal edges a random cost in normal_cost_range.
+    5) Convert the graph to the compatible {node: {neighbor: cost}} format, or to a compact TCGRE_Instance.
+    '''
+    def __init__(self, risk_edge_ratio, seed=None, risk_cost=20, normal_cost_range=(1, 10)):
+        self.risk_edge_ratio = risk_edge_ratio # risk edges to total edges ratio
+        self.risk_cost = risk_cost # cost of the risk edges
+        self.normal_cost_range = normal_cost_range # (low, high) inclusive range of the normal edge costs
+        self.seed = seed
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
+        self.params = None # parameters of the generator, set by create_generator
+        self.risk_edges_with_support_nodes = None # Risk edges with support nodes
+        self.risk_edges = None
+        self.risk_edge_mask = None # bool mask of the risk edges in the order of TCGRE_G.edges()
+        self.edge_costs = None # cost of every edge in the order of TCGRE_G.edges()
+        self.edge_array = None # (E, 2) node indices of the edges in the order of TCGRE_G.edges()
+        self.graph_arrays = None # (nodes, indptr, indices) CSR neighbor arrays of TCGRE_G
+        self.arrays_graph = None # graph the edge and neighbor arrays were built from
+
+        self.source = None # start node, first node of the graph if not set
+        self.target = None # target node, last node of the graph if not set
+
+        self.TCGRE_G = None # TCGRE Graph
+
+    # create the base graph of the family, implemented by every generator
+    def create_graph(self):
+        raise NotImplementedError
+
+    # source and target nodes for the shortest path
+    def get_source_and_target(self):
+        nodes = list(self.TCGRE_G.nodes())
+        source = self.source if self.source is not None else nodes[0]
+        target = self.target if self.target is not None else nodes[-1]
+        return source, target
+
+    # pick edges on the shortest path for additional risk edges, returns the number of shortest
+    # paths and the unique edges on them, oriented from the source to the target.
+    def pick_edges_on_shortest_path(self):
+        num_paths, unique_edges, _ = self.find_shortest_path_dag()
+        return num_paths, unique_edges
+
+    # shortest path DAG from the source to the target: the number of shortest paths, its edges and their
+    # indices in the order of TCGRE_G.edges(). An edge (u, v) is on a shortest path iff
+    # d_s(u) + w(u, v) + d_t(v) = d_s(t), so two Dijkstra sweeps find all of them in O(E log V)
+    # without enumerating the paths.
+    def find_shortest_path_dag(self):
+        source, target = self.get_source_and_target()
+        logger.debug("Source: %s, Target: %s", source, target)
+        # distances from the source and to the target
+        source_distances = nx.single_source_dijkstra_path_length(self.TCGRE_G, source, weight='weight')
+        if target not in source_distances:
+            raise nx.NetworkXNoPath(f"Target {target} cannot be reached from source {source}")
+        target_distances = nx.single_source_dijkstra_path_length(self.TCGRE_G, target, weight='weight')
+        shortest_distance = source_distances[target]
+
+        # edges of the shortest path DAG
+        unique_edges = []
+        edge_index = []
+        for index, (u, v, w) in enumerate(self.TCGRE_G.edges(data='weight', default=1)):
+            if u == v or u not in source_distances:
+                continue
+            if source_distances[u] + w + target_distances[v] == shortest_distance:
+                unique_edges.append((u, v))
+            elif source_distances[v] + w + target_distances[u] == shortest_distance:
+                unique_edges.append((v, u))
+            else:
+                continue
+            edge_index.append(index)
+
+        # number of shortest paths to every node of the DAG, in the order of the distance from the source
+        num_paths = {source: 1}
+        for u, v in sorted(unique_edges, key=lambda edge: source_distances[edge[0]]):
+            num_paths[v] = num_paths.get(v, 0) + num_paths[u]
+        return num_paths[target], unique_edges, np.array(edge_index, dtype=np.int64)
+
+    # CSR neighbor arrays of the graph: the nodes, and the neighbors of node i (nodes[i]) are
+    # indices[indptr[i]:indptr[i+1]], in the order of TCGRE_G.neighbors
+    def neighbor_arrays(self):
+        adjacency = self.TCGRE_G.adj
+        nodes = list(adjacency)
+        node_index = {node: i for i, node in enumerate(nodes)}
+        degrees = np.fromiter(map(len, adjacency.values()), dtype=np.int64, count=len(nodes))
+        indptr = np.concatenate(([0], np.cumsum(degrees)))
+        indices = np.fromiter(map(node_index.__getitem__, chain.from_iterable(adjacency.values())),
+                              dtype=np.int64, count=indptr[-1])
+        return nodes, indptr, indices
+
+    # build the CSR neighbor arrays and the edge array of TCGRE_G once, after create_graph, for the risk
+    # edges, the costs and the instance. TCGRE_G.edges() yields every edge from the first of its nodes in
+    # the adjacency order, so the CSR entries from a node to itself or a later node are the edges in order.
+    def build_graph_arrays(self):
+        nodes, indptr, indices = self.neighbor_arrays()
+        rows = np.repeat(np.arange(len(nodes), dtype=np.int64), np.diff(indptr))
+        upper = indices >= rows
+        self.edge_array = np.column_stack((rows[upper], indices[upper]))
+        self.graph_arrays = (nodes, indptr, indices)
+        self.arrays_graph = self.TCGRE_G
+        return self.edge_array
+
+    # CSR neighbor arrays and edge array of TCGRE_G, built again only if the graph was replaced
+    def get_graph_arrays(self):
+        if self.arrays_graph is not self.TCGRE_G:
+            self.build_graph_arrays()
+        nodes, indptr, indices = self.graph_arrays
+        return nodes, indptr, indices, self.edge_array
+
+    # edges of TCGRE_G with the original node labels for rows of the edge array
+    def edge_labels(self, edge_array):
+        nodes = self.graph_arrays[0]
+        return list(zip(map(nodes.__getitem__, edge_array[:, 0].tolist()), map(nodes.__getitem__, edge_array[:, 1].tolist())))
+
+    # pick neighbors of the risk edges as support nodes, a random neighbor of either end of the edge that is
+    # not the support node of another risk edge yet. If all of them are, a random neighbor is shared.
+    # risk_edge_array has the node indices of the risk edges if they are known already.
+    def pick_support_nodes(self, risk_edges, risk_edge_array=None):
+        nodes, indptr, indices, _ = self.get_graph_arrays()
+        if risk_edge_array is None:
+            node_index = {node: i for i, node in enumerate(nodes)}
+            risk_edge_array = np.array([(node_index[u], node_index[v]) for u, v in risk_edges], dtype=np.int64).reshape(-1, 2)
+        first, second = risk_edge_array[:, 0], risk_edge_array[:, 1]
+        first_degree = indptr[first + 1] - indptr[first]
+        second_degree = indptr[second + 1] - indptr[second]
+
+        # draw one random neighbor of either end for all the risk edges at once
+        position = self.rng.integers(0, first_degree + second_degree) if len(risk_edges) else first
+        offset = np.where(position < first_degree, indptr[first] + position, indptr[second] + position - first_degree)
+        support_nodes = indices[offset].tolist()
+
+        # only the risk edges whose neighbor is already used draw again, from their unused neighbors
+        used = np.zeros(len(nodes), dtype=bool) # bitmap of the nodes used as support nodes
+        num_shared = 0
+        for k, support_node in enumerate(support_nodes):
+            if used[support_node]:
+                neighbors = np.concatenate((indices[indptr[first[k]]:indptr[first[k] + 1]],
+                                            indices[indptr[second[k]]:indptr[second[k] + 1]]))
+                unused = neighbors[~used[neighbors]]
+                if len(unused):
+                    support_nodes[k] = int(unused[self.rng.integers(len(unused))])
+                else:
+                    # all the neighbors are support nodes already, keep the random one
+                    num_shared += 1
+            used[support_nodes[k]] = True
+
+        logger.info("Picked support nodes of %d risk edges, %d of them share a support node", len(risk_edges), num_shared)
+        return {edge: (nodes[support_node],) for edge, support_node in zip(risk_edges, support_nodes)}
+
+    # pick the risk edges and support nodes
+    def pick_risk_edges_and_support_nodes(self):
+        # Calculate the number of edges to select as risky
+        _, _, _, edge_array = self.get_graph_arrays()
+        num_edges = len(edge_array)
+        num_risk_edges = int(num_edges * self.risk_edge_ratio)
+
+        ## one way: add at least some risk edges on the shortest path with other edges
+        _, _, shortest_path_index = self.find_shortest_path_dag()
+        # Randomly select edge indices without replacement, in one call
+        risk_edge_mask = np.zeros(num_edges, dtype=bool)
+        risk_edge_mask[self.rng.choice(num_edges, max(num_risk_edges - 1, 0), replace=False)] = True
+        # the edges on the shortest path that are not risk edges yet, compared by index so the
+        # orientation of the edges does not matter
+        available_index = shortest_path_index[~risk_edge_mask[shortest_path_index]]
+        ## add the edge on the shortest path
+        if len(available_index):
+            chosen_index = available_index[self.rng.integers(len(available_index))]
+            logger.debug("chosen_edge: %s", self.edge_labels(edge_array[[chosen_index]])[0])
+            risk_edge_mask[chosen_index] = True
+        risk_edge_array = edge_array[risk_edge_mask]
+        self.risk_edge_mask = risk_edge_mask
+
+        ## pick up neighbors of the risk edges as support nodes
+        self.risk_edges = self.pick_support_nodes(self.edge_labels(risk_edge_array), risk_edge_array)
+        self.risk_edges_with_support_nodes = self.risk_edges
+        return self.risk_edges
+
+    #  add cost to the edges including the risk edges
+    def add_cost_to_edges(self):
+        _, _, _, edge_array = self.get_graph_arrays()
+        edges = self.edge_labels(edge_array)
+        risk_edge_mask = self.risk_edge_mask
+        if risk_edge_mask is None:
+            risk_edge_mask = np.fromiter((edge in self.risk_edges for edge in edges), dtype=bool, count=len(edges))
+
+        # draw the random costs of all the edges at once, between low and high, lesser than the risk edge cost
+        low, high = self.normal_cost_range
+        edge_costs = self.rng.integers(low, high, size=len(edges), endpoint=True)
+        edge_costs[risk_edge_mask] = self.risk_cost
+        self.edge_costs = edge_costs
+
+        # risk edges get [risk_cost, (support_node,)], normal edges their cost, set in one bulk update
+        costs = edge_costs.tolist()
+        for index in np.flatnonzero(risk_edge_mask).tolist():
+            costs[index] = [self.risk_cost, self.risk_edges[edges[index]]]
+        nx.set_edge_attributes(self.TCGRE_G, dict(zip(edges, costs)), 'cost')
+        logger.info("Added cost to %d edges, %d of them risk edges", len(edges), risk_edge_mask.sum())
+        return self.TCGRE_G
+
+    # convert the graph to compatible graph
+    def convert_to_compatible_graph(self):
+        nodes = {node: {} for node in self.TCGRE_G.nodes()}
+        for edge in self.TCGRE_G.edges():
+            # Unpack the edge nodes
+            node1, node2 = edge
+            nodes[node1][node2] = self.TCGRE_G[node1][node2]['cost']  # For node1 -> node2
+            nodes[node2][node1] =  self.TCGRE_G[node1][node2]['cost'] # For node2 -> node1
+        return nodes
+
+    # compact array instance of the graph with 0-based node indices, see TCGRE_Instance
+    def to_instance(self):
+        source, target = self.get_source_and_target()
+        if self.edge_costs is None:
+            # the costs were not added by add_cost_to_edges, read them from the graph
+            instance = TCGRE_Instance.from_graph(self.TCGRE_G, source, target)
+            instance.meta = self.instance_meta()
+            return instance
+        nodes, indptr, indices, edge_array = self.get_graph_arrays()
+        node_index = {node: i for i, node in enumerate(nodes)}
+
+        # support node of every risk edge, in the order of TCGRE_G.edges()
+        support = np.full(len(edge_array), -1, dtype=np.int32)
+        risk_index = np.flatnonzero(self.risk_edge_mask)
+        support[risk_index] = [node_index[self.risk_edges[edge][0]] for edge in self.edge_labels(edge_array[risk_index])]
+
+        # edge of every CSR entry, found by its undirected pair key among the keys of the edges
+        edge_keys = pair_keys(edge_array[:, 0], edge_array[:, 1], len(nodes))
+        order = np.argsort(edge_keys)
+        rows = np.repeat(np.arange(len(nodes)), np.diff(indptr))
+        entry_edges = order[np.searchsorted(edge_keys, pair_keys(rows, indices, len(nodes)), sorter=order)]
+        return TCGRE_Instance(indptr, indices, self.edge_costs[entry_edges], self.risk_edge_mask[entry_edges], support[entry_edges],
+                              node_index[source], node_index[target], nodes, self.instance_meta())
+
+    # family, parameters and seed of the generator, as plain JSON values
+    def instance_meta(self):
+        return {'family': getattr(self, 'name', type(self).__name__), 'params': self.params, 'seed': describe_seed(self.seed)}
+
+    # run all the steps and return the compatible graph, or the TCGRE_Instance if compact.
+    # The time of every phase is logged.
+    def generate(self, compact=False):
+        start = time.perf_counter()
+        self.create_graph()
+        self.build_graph_arrays()
+        created = time.perf_counter()
+        self.pick_risk_edges_and_support_nodes()
+        picked = time.perf_counter()
+        self.add_cost_to_edges()
+        costed = time.perf_counter()
+        compatible_graph = self.to_instance() if compact else self.convert_to_compatible_graph()
+        converted = time.perf_counter()
+        logger.info("Generated %d nodes, %d edges, %d risk edges in %.3f s (create %.3f s, risk edges %.3f s, cost %.3f s, convert %.3f s)",
+                    self.TCGRE_G.number_of_nodes(), self.TCGRE_G.number_of_edges(), len(self.risk_edges), converted - start,
+                    created - start, picked - created, costed - picked, converted - costed)
+        return compatible_graph
@@ -0,0 +1,69 @@
+'''
+Batch generation of TCGRE instances over a process pool.
+
+Instance i of a batch is seeded with the i-th child of the root seed
+(numpy SeedSequence with spawn_key=(i,)), so it comes out the same whatever
+the number of workers or the order in which the instances are run.
+'''
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .registry import create_generator
+
+
+# seed sequence of instance index in a batch with the root seed
+def instance_seed(root_seed, index):
+    return np.random.SeedSequence(root_seed, spawn_key=(index,))
+
+
+# root seed of a batch, drawn if not given so the batch can still be reproduced from its instances
+def resolve_root_seed(root_seed):
+    if root_seed is None:
+        root_seed = np.random.SeedSequence().entropy
+    return root_seed
+
+
+# generate one TCGRE instance, the unit of work of generate_batch
+def generate_instance(name, params, root_seed, index, compact=False):
+    tcgre_gen = create_generator(name, seed=instance_seed(root_seed, index), **params)
+    return tcgre_gen.generate(compact=compact)
+
+
+# generate the instances of a chunk of indices of a batch, one task of the process pool
+def generate_instances(name, params, root_seed, indices, compact=False):
+    return [generate_instance(name, params, root_seed, index, compact) for index in indices]
+
+
+# generate count instances of a generator family with the same parameters,
+# as compatible graphs or as TCGRE_Instance arrays if compact
+def generate_batch(name, params, count, root_seed=None, max_workers=None, chunksize=1, compact=False):
+    return list(iter_batch(name, params, count, root_seed, max_workers, chunksize, compact))
+
+
+# yield the instances of generate_batch in order as they are done. At most window instances
+# are in flight, so a large batch can be streamed to a file without holding it in memory.
+# A new chunk is submitted as soon as the oldest one is yielded, so the workers do not wait
+# for the slowest instance of a window.
+def iter_batch(name, params, count, root_seed=None, max_workers=None, chunksize=1, compact=False, window=None):
+    root_seed = resolve_root_seed(root_seed)
+
+    if max_workers == 1:
+        for index in range(count):
+            yield generate_instance(name, params, root_seed, index, compact)
+        return
+
+    if window is None:
+        window = 4 * (max_workers or os.cpu_count() or 1) * chunksize
+    max_pending = max(window // chunksize, 1) # chunks in flight
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for start in range(0, count, chunksize):
+            indices = range(start, min(start + chunksize, count))
+            pending.append(executor.submit(generate_instances, name, params, root_seed, indices, compact))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,157 @@
+'''
+Content-addressed cache of generated TCGRE instances.
+
+The key of an instance is the SHA-256 of its generator family, parameters with
+the defaults of the generator filled in and seed, together with the code
+version, a hash of the source files of the tcgre package, so a change to any
+generator invalidates the cached instances. Every entry is one file in the
+binary instance format, loaded through a memory map on a hit. Hits refresh the
+modification time of the entry, and when the entries take more than max_bytes
+the least recently used ones are removed, down to EVICT_TO of max_bytes. A
+running total of their size is kept, so the entries are only listed when the
+cache is full.
+
+Instances without a reproducible seed (None or a numpy Generator) are generated
+every time and not cached.
+'''
+import hashlib
+import inspect
+import json
+import logging
+import os
+import uuid
+
+from .base import describe_seed
+from .instance_file import save_instance, load_instance
+from .registry import create_generator, get_generator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+EVICT_TO = 0.9 # a full cache is evicted to this fraction of max_bytes, so it is not listed again on the next put
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+CODE_VERSION = None # hash of the tcgre sources, computed when first needed
+
+
+# hash of the source files of the tcgre package
+def code_version():
+    global CODE_VERSION
+    if CODE_VERSION is None:
+        digest = hashlib.sha256()
+        for directory, directories, files in sorted(os.walk(PACKAGE_DIR)):
+            directories.sort()
+            for file_name in sorted(files):
+                if file_name.endswith('.py'):
+                    path = os.path.join(directory, file_name)
+                    digest.update(os.path.relpath(path, PACKAGE_DIR).encode('utf-8'))
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+        CODE_VERSION = digest.hexdigest()
+    return CODE_VERSION
+
+
+# parameters of the family name with the defaults of its generator filled in, so parameters that only
+# spell out a default describe the same instance
+def full_params(name, params):
+    bound = inspect.signature(get_generator(name).__init__).bind(None, **params)
+    bound.apply_defaults()
+    return {key: value for key, value in list(bound.arguments.items())[1:] if key != 'seed'}
+
+
+class TCGRE_Cache:
+    '''
+    1) generate(name, params, seed) returns the cached TCGRE_Instance on a hit, or generates and stores it.
+    2) key(name, params, seed) is the content address of an instance, None if the seed is not reproducible.
+    3) evict() removes the least recently used entries until they fit in max_bytes, put() only calls it
+       when the running total of the entries is over max_bytes.
+    '''
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        # bytes of the entries as of the last scan plus the entries put since, None before the first scan.
+        # Entries put by other processes are only counted by the next scan.
+        self.total_bytes = None
+
+    # content address of an instance of the family name with its parameters and seed
+    def key(self, name, params, seed):
+        seed = describe_seed(seed)
+        if seed is None:
+            return None
+        config = {'family': name, 'params': full_params(name, params), 'seed': seed, 'code_version': code_version()}
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.path, f"{key}.bin")
+
+    # cached instance or None
+    def get(self, name, params, seed):
+        key = self.key(name, params, seed)
+        if key is None:
+            return None
+        path = self.entry_path(key)
+        try:
+            instance = load_instance(path)
+            # mark the entry as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return instance
+
+    # store an instance, written to a temporary file first so readers never see a partial entry
+    def put(self, name, params, seed, instance):
+        key = self.key(name, params, seed)
+        if key is None:
+            return None
+        path = self.entry_path(key)
+        temporary_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        save_instance(instance, temporary_path)
+        os.replace(temporary_path, path)
+        if self.total_bytes is not None:
+            self.total_bytes += os.path.getsize(path)
+        # the entries are only listed when they may take more than max_bytes
+        if self.total_bytes is None or self.total_bytes > self.max_bytes:
+            self.evict(int(self.max_bytes * EVICT_TO))
+        return path
+
+    # instance of the family name with its parameters and seed, from the cache if it is there
+    def generate(self, name, params, seed):
+        instance = self.get(name, params, seed)
+        if instance is not None:
+            self.hits += 1
+            logger.debug("Cache hit for %s %s seed %s", name, params, seed)
+            return instance
+        self.misses += 1
+        instance = create_generator(name, seed=seed, **params).generate(compact=True)
+        self.put(name, params, seed, instance)
+        return instance
+
+    # remove the least recently used entries until the entries take at most max_bytes, or target_bytes if given
+    def evict(self, target_bytes=None):
+        if target_bytes is None:
+            target_bytes = self.max_bytes
+        entries = []
+        for file_name in os.listdir(self.path):
+            if file_name.endswith('.bin'):
+                try:
+                    stat = os.stat(os.path.join(self.path, file_name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, file_name))
+        total = sum(size for _, size, _ in entries)
+        num_removed = 0
+        for _, size, file_name in sorted(entries):
+            if total <= target_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, file_name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            num_removed += 1
+        self.total_bytes = total
+        if num_removed:
+            logger.info("Evicted %d cached instances, %d bytes left", num_removed, total)
+        return num_removed
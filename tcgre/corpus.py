@@ -0,0 +1,174 @@
+'''
+Sharded on-disk corpus of TCGRE instances with a random-access index.
+
+A corpus is a directory. Instances are appended in the binary instance format
+to shard files, a new shard is started once the current one reaches
+shard_size bytes. Every writer (one per process) appends to its own shards and
+its own index file, so batch workers append in parallel without any locking.
+
+The index files are JSON Lines, one line per instance with its key
+(family, params, seed, index) and its shard and offset. Opening the corpus
+reads them into a dict, so an instance is found in O(1) and loaded through a
+memory map of its shard.
+'''
+import json
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from .batch import generate_instance, resolve_root_seed
+from .instance_file import write_instance, load_instance
+
+DEFAULT_SHARD_SIZE = 256 * 1024 * 1024
+
+
+# hashable key of an instance, params are compared as sorted JSON. The root seed is an int or a
+# sequence of ints, numpy ints included
+def corpus_key(family, params, seed, index):
+    return (family, json.dumps(params, sort_keys=True), json.dumps(np.asarray(seed).tolist()), int(index))
+
+
+# (family, params, seed, index) of an instance from its meta: a batch instance has the root seed and
+# its index in the batch, an instance generated alone with an integer seed has the seed and index 0
+def instance_key(meta):
+    seed = meta.get('seed')
+    if isinstance(seed, dict) and len(seed.get('spawn_key', ())) == 1:
+        return meta.get('family'), meta.get('params'), seed['entropy'], seed['spawn_key'][0]
+    if isinstance(seed, int):
+        return meta.get('family'), meta.get('params'), seed, 0
+    raise Exception("The instance has no root seed and index for the corpus key, pass the key to append")
+
+
+class TCGRE_Corpus:
+    '''
+    1) append(instance) writes the instance to the shard of this writer and adds a line to its index file.
+    2) get(family, params, seed, index) loads an instance through the index, corpus[key] with a corpus_key.
+    3) refresh() reads the index files again, e.g. after other processes appended to the corpus.
+    4) load_index=False opens the corpus for appending only, without reading the index files.
+    '''
+    def __init__(self, path, shard_size=DEFAULT_SHARD_SIZE, load_index=True):
+        self.path = path
+        self.shard_size = shard_size
+        os.makedirs(path, exist_ok=True)
+
+        self.writer_id = None # name of the shards and index file of this writer, set on the first append
+        self.shard_number = 0
+        self.shard_name = None
+        self.shard_file = None
+        self.index_file = None
+
+        self.index = {} # corpus_key -> (shard name, offset)
+        if load_index:
+            self.refresh()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __getitem__(self, key):
+        shard_name, offset = self.index[key]
+        return load_instance(os.path.join(self.path, shard_name), offset)
+
+    def keys(self):
+        return self.index.keys()
+
+    # load an instance by its key
+    def get(self, family, params, seed, index):
+        return self[corpus_key(family, params, seed, index)]
+
+    # read all the index files of the corpus
+    def refresh(self):
+        index = {}
+        for file_name in sorted(os.listdir(self.path)):
+            if not (file_name.startswith('index-') and file_name.endswith('.jsonl')):
+                continue
+            with open(os.path.join(self.path, file_name), encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # the last line of a writer that was stopped while writing it
+                        continue
+                    key = corpus_key(entry['family'], entry['params'], entry['seed'], entry['index'])
+                    index[key] = (entry['shard'], entry['offset'])
+        self.index = index
+        return self
+
+    # start the next shard of this writer
+    def open_shard(self):
+        if self.shard_file is not None:
+            self.shard_file.close()
+        if self.writer_id is None:
+            self.writer_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            self.index_file = open(os.path.join(self.path, f"index-{self.writer_id}.jsonl"), 'a', encoding='utf-8')
+        self.shard_name = f"shard-{self.writer_id}-{self.shard_number:05d}.bin"
+        self.shard_number += 1
+        self.shard_file = open(os.path.join(self.path, self.shard_name), 'wb')
+
+    # append an instance, its key is taken from its meta if not given as (family, params, seed, index)
+    def append(self, instance, key=None):
+        family, params, seed, index = key if key is not None else instance_key(instance.meta)
+        if self.shard_file is None or self.shard_file.tell() >= self.shard_size:
+            self.open_shard()
+        offset = self.shard_file.tell()
+        write_instance(self.shard_file, instance)
+        # the instance is on disk before the index line that points to it
+        self.shard_file.flush()
+        self.index_file.write(json.dumps({'family': family, 'params': params, 'seed': seed, 'index': index,
+                                          'shard': self.shard_name, 'offset': offset}) + '\n')
+        self.index_file.flush()
+        corpus_index = corpus_key(family, params, seed, index)
+        self.index[corpus_index] = (self.shard_name, offset)
+        return corpus_index
+
+    def close(self):
+        for f in (self.shard_file, self.index_file):
+            if f is not None:
+                f.close()
+        self.shard_file = self.index_file = None
+        self.writer_id = None
+        self.shard_number = 0
+
+
+# corpus writer of this process for every corpus path, used by the batch workers
+WRITERS = {}
+
+
+# generate instances of a batch and append them to the corpus writer of this process
+def append_instances(path, shard_size, name, params, root_seed, indices):
+    if path not in WRITERS:
+        # the workers only append, so they do not read the index of the whole corpus
+        WRITERS[path] = TCGRE_Corpus(path, shard_size, load_index=False)
+    corpus = WRITERS[path]
+    for index in indices:
+        corpus.append(generate_instance(name, params, root_seed, index, compact=True))
+    return len(indices)
+
+
+# generate count instances of a family into the corpus at path, every worker appends to its own shards.
+# Returns the root seed, the instances are then found with corpus.get(name, params, root_seed, index).
+def append_batch(path, name, params, count, root_seed=None, max_workers=None, chunksize=16, shard_size=DEFAULT_SHARD_SIZE):
+    root_seed = resolve_root_seed(root_seed)
+    chunks = [range(start, min(start + chunksize, count)) for start in range(0, count, chunksize)]
+
+    if max_workers == 1:
+        with TCGRE_Corpus(path, shard_size, load_index=False) as corpus:
+            for index in range(count):
+                corpus.append(generate_instance(name, params, root_seed, index, compact=True))
+        return root_seed
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(append_instances, repeat(path), repeat(shard_size), repeat(name), repeat(params),
+                          repeat(root_seed), chunks))
+    return root_seed
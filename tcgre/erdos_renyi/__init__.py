@@ -0,0 +1,4 @@
+from .er_rg_probability import ErdosRenyi_GNP_Graph_Generator
+from .er_rg_edges import ErdosRenyi_GNM_Graph_Generator
+from .tcgre_er_rg_probability import TCGRE_ErdosRenyi_GNP_Graph_Generator
+from .tcgre_er_rg_edges import TCGRE_ErdosRenyi_GNM_Graph_Generator
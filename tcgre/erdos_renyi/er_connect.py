@@ -0,0 +1,32 @@
+import logging
+import networkx as nx
+from ..sampling import random_bridges
+
+logger = logging.getLogger(__name__)
+
+
+# make an Erdos Renyi graph connected in one pass, returns the connected graph and the added edges.
+# 'bridge' adds one random edge per extra component, the fewest edges that connect the graph.
+# 'giant' keeps the largest component only, relabelled 0..k-1 in the order of the old labels.
+def make_connected(G, connect, seed=None):
+    if connect not in ('bridge', 'giant'):
+        raise Exception(f"Unknown connect option '{connect}', use None, 'bridge' or 'giant'")
+    components = [list(component) for component in nx.connected_components(G)]
+    if len(components) <= 1:
+        return G, []
+    if connect == 'bridge':
+        bridges = random_bridges(components, seed)
+        G.add_edges_from(bridges)
+        return G, bridges
+    giant = G.subgraph(max(components, key=len))
+    return nx.convert_node_labels_to_integers(giant, ordering='sorted'), []
+
+
+# make the graph of an Erdos Renyi TCGRE generator connected with its connect option and random number
+# generator, so the target can be reached from the source. Returns the connected graph, the added edges
+# and the new target, the last node, as the giant component has new labels 0..k-1.
+def connect_generator_graph(generator):
+    num_nodes = generator.TCGRE_G.number_of_nodes()
+    G, added_edges = make_connected(generator.TCGRE_G, generator.connect, generator.rng)
+    logger.info("Connected graph: %d edges added, %d nodes dropped", len(added_edges), num_nodes - G.number_of_nodes())
+    return G, added_edges, G.number_of_nodes() - 1
@@ -1,5 +1,5 @@
 import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
 
 class ErdosRenyi_GNM_Graph_Generator:
     '''
@@ -11,27 +11,24 @@ class ErdosRenyi_GNM_Graph_Generator:
     Note: For n=10 nodes, there are nC2 = 45 possible edges that can be added.
     The total number of edges M is specified by the user and should be less than nC2.
     '''
-    def __init__(self, n, M):
+    def __init__(self, n, M, seed=None):
         self.n = n
         self.M = M
         self.G = None
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
 
     # Create a random graph using the G(n, M) model
     def create_gnm_random_graph(self):
         # Check if the number of edges M is less than n*(n-1)/2
         if self.M > self.n*(self.n-1)/2:
             raise Exception(f"Number of edges M should be less than n*(n-1)/2 = {self.n*(self.n-1)/2}")
-        G = nx.gnm_random_graph(self.n, self.M)
+        G = nx.gnm_random_graph(self.n, self.M, seed=self.rng)
         self.G = G
         return self.G
     
     # Plot the graph
     def draw_ER_graph(self):
-        plt.figure(figsize=(8, 6))
-        nx.draw(self.G, with_labels=True, node_color='lightgreen', node_size=700, edge_color='k')
-        plt.title('Random Graph from G(n, M) Model')
+        from ..plotting import draw_graph, save_figure
+        fig = draw_graph(self.G, 'Random Graph from G(n, M) Model', figsize=(8, 6), with_labels=True, node_color='lightgreen', node_size=700, edge_color='k')
         # Save the plot
-        plt.savefig(f'./erdos_renyi/plots/random_graph_gnm_G({self.n},{self.M}).png')
-        # Show the plot
-        plt.show()
-
+        return save_figure(fig, f'./tcgre/erdos_renyi/plots/random_graph_gnm_G({self.n},{self.M}).png')
@@ -0,0 +1,57 @@
+import networkx as nx
+import numpy as np
+from ..sampling import geometric_skip_pairs, pair_index_to_edges
+
+class ErdosRenyi_GNP_Graph_Generator:
+    '''
+    1) Nodes Initialization: The graph starts with n nodes and no edges.
+    2) Edge Consideration: For each pair of nodes (let's say nodes i and j), the algorithm considers whether to add an edge between them.
+    3) Random Decision: For each pair, a random number is generated (typically uniformly distributed between 0 and 1). If this number is less than or equal to 
+    p, an edge between i and j is added to the graph. If the number is greater than 
+    p, no edge is added between those nodes.
+    
+    Note: For n=10 nodes, there are nC2 = 45 possible edges that can be added. 
+    When you use p=0.3, each of these 45 possible edges has a 30% chance of being included in the graph.
+
+    method='skip' draws only the added edges, skipping a geometric number of pairs between them, in O(n + m)
+    instead of testing all the pairs with method='networkx'. Both give the same distribution of graphs.
+    method='auto' uses 'skip' for p below sparse_threshold.
+    '''
+    sparse_threshold = 0.1
+
+    def __init__(self, n, p, seed=None, method='auto'):
+        self.n = n
+        self.p = p
+        self.method = method
+        self.G = None
+        self.edges = None # (m, 2) edge array of the skip sampler
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
+
+    # Create a random graph using the G(n, p) model
+    def create_gnp_random_graph(self):
+        method = self.method
+        if method == 'auto':
+            method = 'skip' if self.p < self.sparse_threshold else 'networkx'
+        if method == 'skip':
+            self.edges = self.generate_gnp_edges()
+            G = nx.Graph()
+            G.add_nodes_from(range(self.n))
+            G.add_edges_from(self.edges.tolist())
+        elif method == 'networkx':
+            G = nx.erdos_renyi_graph(self.n, self.p, seed=self.rng)
+        else:
+            raise Exception(f"Unknown G(n, p) method '{self.method}', use 'auto', 'skip' or 'networkx'")
+        self.G = G
+        return self.G
+
+    # edges of the G(n, p) graph as an (m, 2) int32 array with i < j, from the geometric skip sampler
+    def generate_gnp_edges(self):
+        pair_index = geometric_skip_pairs(self.n, self.p, self.rng)
+        return pair_index_to_edges(pair_index).astype(np.int32)
+    
+    # Plot the graph
+    def draw_ER_graph(self):
+        from ..plotting import draw_graph, save_figure
+        fig = draw_graph(self.G, 'Random Graph from G(n, p) Model', figsize=(8, 6), with_labels=True, node_color='skyblue', node_size=700, edge_color='k')
+        # Save the plot
+        return save_figure(fig, f'./tcgre/erdos_renyi/plots/random_graph_gnp_G({self.n},{self.p}).png')
@@ -0,0 +1,59 @@
+import logging
+import networkx as nx
+from ..base import TCGRE_Graph_Generator
+from ..registry import register_generator
+from .er_connect import connect_generator_graph
+from .er_rg_probability import ErdosRenyi_GNP_Graph_Generator
+
+logger = logging.getLogger(__name__)
+
+@register_generator('erdos_renyi_gnp')
+class TCGRE_ErdosRenyi_GNP_Graph_Generator(TCGRE_Graph_Generator):
+
+    def __init__(self, n, p, risk_edge_ratio, method='auto', connect=None, risk_cost=20, normal_cost_range=(1, 10), seed=None):
+        super().__init__(risk_edge_ratio, seed, risk_cost, normal_cost_range)
+        self.n = n
+        self.p = p
+        self.method = method # 'auto', 'skip' or 'networkx' edge sampling
+        self.connect = connect # None, 'bridge' or 'giant' to make the graph connected
+        self.added_edges = [] # edges added to connect the graph
+
+        self.source = 0 # default start node
+        self.target = n-1 # default target node
+
+    # Create tcgre random graph using the G(n, p) model
+    def create_tcgre_gnp_random_graph(self):
+        G = ErdosRenyi_GNP_Graph_Generator(self.n, self.p, seed=self.rng, method=self.method)
+        self.TCGRE_G = G.create_gnp_random_graph()
+        if self.connect is not None:
+            self.TCGRE_G, self.added_edges, self.target = connect_generator_graph(self)
+        logger.info("Erdos Renyi Graph created: %d nodes, %d edges", self.TCGRE_G.number_of_nodes(), self.TCGRE_G.number_of_edges())
+        return self.TCGRE_G
+
+    def create_graph(self):
+        return self.create_tcgre_gnp_random_graph()
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        edge_labels = nx.get_edge_attributes(self.TCGRE_G, 'cost')
+        fig = draw_graph(self.TCGRE_G, "TCGRE Erodos Renyi Graph using G(n, p) Model", edge_labels=edge_labels, edge_label_color='black', risk_edges=self.risk_edges.keys(),
+                         with_labels=True, node_size=500, node_color='skyblue', font_color='w', edge_color='gray')
+        # Save the plot
+        return save_figure(fig, f"./tcgre/erdos_renyi/plots/tcgre_erdos_renyi_gnp_graph_N{self.n}.png")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    # # Parameters
+    n = 10  # number of nodes
+    p = 0.5  # probability of an edge # 0.5 default answer
+    risk_edge_ratio = 0.2 # 20% of the total edges
+
+    # # Create a random graph using the G(n, p) model
+    tcgre_er_p = TCGRE_ErdosRenyi_GNP_Graph_Generator(n, p, risk_edge_ratio)
+    tcgre_er_p.create_tcgre_gnp_random_graph()
+    tcgre_er_p.pick_risk_edges_and_support_nodes()
+    tcgre_er_p.add_cost_to_edges()
+    # tcgre_er_p.plot_graph() # plot the graph
+    graph_info_tcgre_er_p = tcgre_er_p.convert_to_compatible_graph()
+    print(f"Graph Info: {graph_info_tcgre_er_p}")
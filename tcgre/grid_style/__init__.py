@@ -0,0 +1,2 @@
+from .gs_rg import GridStyle_Graph_Generator
+from .tcgre_gs_rg_generator import TCGRE_GridStyle_Graph_Generator
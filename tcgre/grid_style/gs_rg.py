@@ -1,9 +1,4 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import numpy as np
-import random
-import json
-import time
 
 
 class GridStyle_Graph_Generator:
@@ -35,15 +30,9 @@ class GridStyle_Graph_Generator:
     
     # Plot the graph
     def plot_graph(self):
-        plt.figure(figsize=(8, 5))
+        from ..plotting import draw_graph, save_figure
         # Using nx.spring_layout for positioning nodes, with the incremented graph
-        pos = nx.spring_layout(self.GS_G, seed=42)
-        nx.draw(self.GS_G, pos, with_labels=True, node_color='lightgreen', edge_color='gray')
-        plt.title(f"Grid Style Graph: {self.rows}x{self.cols}")
+        fig = draw_graph(self.GS_G, f"Grid Style Graph: {self.rows}x{self.cols}", layout_seed=42, figsize=(8, 5),
+                         with_labels=True, node_color='lightgreen', edge_color='gray')
         # Save the plot
-        plt.savefig(f'./grid_style/plots/grid_style_N{self.N}.png')
-        # Show the plot
-        plt.show()
-
-  
-
+        return save_figure(fig, f'./tcgre/grid_style/plots/grid_style_N{self.N}.png')
\ No newline at end of file
@@ -0,0 +1,61 @@
+import logging
+from ..base import TCGRE_Graph_Generator
+from ..registry import register_generator
+from .gs_rg import GridStyle_Graph_Generator
+
+logger = logging.getLogger(__name__)
+
+@register_generator('grid_style')
+class TCGRE_GridStyle_Graph_Generator(TCGRE_Graph_Generator):
+    def __init__(self, N, rows, cols, risk_edge_ratio=0.2, risk_cost=20, normal_cost_range=(1, 10), seed=None):
+        super().__init__(risk_edge_ratio, seed, risk_cost, normal_cost_range)
+        self.N = N
+        self.rows = rows
+        self.cols = cols
+
+    def create_gridstyle_graph(self):
+        grid_graph = GridStyle_Graph_Generator(self.N, self.rows, self.cols)
+        grid_graph.create_grid_graph()
+        grid_graph_incremented = grid_graph.increment_node_labels()
+        self.TCGRE_G = grid_graph_incremented
+        logger.info("Grid Style Graph created: %d nodes, %d edges", self.TCGRE_G.number_of_nodes(), self.TCGRE_G.number_of_edges())
+        return self.TCGRE_G
+
+    def create_graph(self):
+        return self.create_gridstyle_graph()
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        # Using nx.spring_layout for positioning nodes, with the incremented graph
+        edge_labels = {(u, v): d['cost'] for u, v, d in self.TCGRE_G.edges(data=True)}
+        fig = draw_graph(self.TCGRE_G, f"TCGRE Grid Style Graph: {self.rows}x{self.cols}", layout_seed=42, edge_labels=edge_labels,
+                         risk_edges=self.risk_edges.keys(), risk_edge_color='red',
+                         with_labels=True, node_size=500, node_color='skyblue', edge_color='gray', font_color='w')
+        # Save the plot
+        return save_figure(fig, f'./tcgre/grid_style/plots/tcgre_grid_N{self.N}.png')
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    '''
+    # Example grid graphs
+    # Grid: 2x5, 10 nodes, node labels: 1 - 10
+    # Grid: 3x5, 15 nodes, node labels: 1 - 15
+    # Grid: 4x5, 20 nodes, node labels: 1 - 20
+    # Grid: 5x5, 25 nodes, node labels: 1 - 25
+    # Grid: 6x5, 30 nodes, node labels: 1 - 30
+    '''
+    # Parameters
+    N = 20 # Number of nodes
+    cols = 5 # Number of columns
+    rows, cols = N//cols, cols # Number of rows and columns
+    risk_edge_ratio = 0.2 # 20% of the edges are risk edges
+
+    # Create a TCGRE Grid Style Graph
+    tcgre_gs = TCGRE_GridStyle_Graph_Generator(N, rows, cols, risk_edge_ratio)
+    tcgre_gs.create_gridstyle_graph()
+    tcgre_gs.pick_risk_edges_and_support_nodes()
+    tcgre_gs.add_cost_to_edges()
+    tcgre_gs.plot_graph() # plot the graph
+    graph_info_tcgre_gs = tcgre_gs.convert_to_compatible_graph()
+    print(f"Graph Info: {graph_info_tcgre_gs}")
@@ -0,0 +1,111 @@
+'''
+Compact array representation of a generated TCGRE instance.
+
+The nodes are 0..n-1, node i has the label labels[i] in the generated graph.
+The neighbors of node i are indices[indptr[i]:indptr[i+1]] (CSR), and every
+entry k of indices has the cost costs[k], is a risk edge if risk[k] and then
+has the support node support[k] (-1 for normal edges). An undirected edge is
+stored in both directions with the same values, a self-loop once.
+'''
+import numpy as np
+
+
+class TCGRE_Instance:
+    '''
+    1) CSR neighbors: indptr (int64, n+1) and indices (int32).
+    2) Per entry: costs (int32), risk (bool) and support (int32, -1 if not a risk edge).
+    3) source and target as node indices, labels (int64) for the original node labels.
+    4) meta: where the instance comes from, the generator family, its parameters and seed.
+    5) to_compatible_graph() builds the legacy {label: {label: cost}} dict when first asked for.
+    '''
+    __slots__ = ('indptr', 'indices', 'costs', 'risk', 'support', 'source', 'target', 'labels', 'meta', '_compatible_graph')
+
+    def __init__(self, indptr, indices, costs, risk, support, source, target, labels=None, meta=None):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.costs = np.asarray(costs, dtype=np.int32)
+        self.risk = np.asarray(risk, dtype=bool)
+        self.support = np.asarray(support, dtype=np.int32)
+        self.source = int(source)
+        self.target = int(target)
+        self.labels = np.arange(len(self.indptr) - 1, dtype=np.int64) if labels is None else np.asarray(labels, dtype=np.int64)
+        self.meta = {} if meta is None else meta
+        self._compatible_graph = None
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__ if name != '_compatible_graph'}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._compatible_graph = None
+
+    def __repr__(self):
+        return (f"TCGRE_Instance(nodes={self.num_nodes}, edges={self.num_edges}, risk_edges={self.num_risk_edges}, "
+                f"source={self.source}, target={self.target})")
+
+    @property
+    def num_nodes(self):
+        return len(self.indptr) - 1
+
+    # CSR entries of every undirected edge once, the entries from a node to itself or a larger node
+    @property
+    def edge_entries(self):
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        return np.flatnonzero(self.indices >= rows)
+
+    @property
+    def num_edges(self):
+        return len(self.edge_entries)
+
+    @property
+    def num_risk_edges(self):
+        return int(self.risk[self.edge_entries].sum())
+
+    # (E, 2) int32 array of the undirected edges with i <= j, in the order of edge_entries
+    def edges(self):
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        entries = self.edge_entries
+        return np.column_stack((rows[entries], self.indices[entries]))
+
+    # neighbors of a node and the costs of the edges to them
+    def neighbors(self, node):
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:end], self.costs[start:end]
+
+    # legacy {node: {neighbor: cost}} dict with the original labels, risk edges cost [cost, (support_node,)]
+    def to_compatible_graph(self):
+        if self._compatible_graph is None:
+            labels = self.labels.tolist()
+            costs = self.costs.tolist()
+            for k in np.flatnonzero(self.risk).tolist():
+                costs[k] = [costs[k], (labels[self.support[k]],)]
+            indices = self.indices.tolist()
+            indptr = self.indptr.tolist()
+            self._compatible_graph = {labels[node]: {labels[neighbor]: cost for neighbor, cost in
+                                                     zip(indices[indptr[node]:indptr[node + 1]], costs[indptr[node]:indptr[node + 1]])}
+                                      for node in range(self.num_nodes)}
+        return self._compatible_graph
+
+    # instance of a networkx graph with 'cost' edge attributes in the legacy format
+    @classmethod
+    def from_graph(cls, G, source, target):
+        nodes = list(G.adj)
+        node_index = {node: i for i, node in enumerate(nodes)}
+        degrees = np.fromiter(map(len, G.adj.values()), dtype=np.int64, count=len(nodes))
+        indptr = np.concatenate(([0], np.cumsum(degrees)))
+        costs = np.empty(indptr[-1], dtype=np.int32)
+        risk = np.zeros(indptr[-1], dtype=bool)
+        support = np.full(indptr[-1], -1, dtype=np.int32)
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        k = 0
+        for node, neighbors in G.adj.items():
+            for neighbor, data in neighbors.items():
+                indices[k] = node_index[neighbor]
+                cost = data['cost']
+                if isinstance(cost, (list, tuple)):
+                    costs[k], risk[k], support[k] = cost[0], True, node_index[cost[1][0]]
+                else:
+                    costs[k] = cost
+                k += 1
+        return cls(indptr, indices, costs, risk, support, node_index[source], node_index[target], nodes)
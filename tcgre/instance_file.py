@@ -0,0 +1,112 @@
+'''
+Binary file format of a TCGRE_Instance, loaded through a memory map.
+
+Layout, all little-endian:
+    magic     8 bytes  b'TCGREINS'
+    version   uint32
+    size      uint32   size of the header in bytes
+    header    JSON     meta (family, params, seed), source, target, number of nodes
+                       and the dtype, offset and length of every array
+    arrays    indptr, indices, costs, risk, support and labels, each at an offset
+              aligned to ALIGNMENT bytes
+
+load_instance maps the file once and the arrays of the instance are read-only
+views of the map, so nothing is copied and processes loading the same file share
+its pages through the page cache. Several instances can follow each other in one
+file, each one starting at an aligned offset.
+'''
+import json
+import struct
+
+import numpy as np
+
+from .instance import TCGRE_Instance
+
+MAGIC = b'TCGREINS'
+VERSION = 1
+ALIGNMENT = 64
+PREFIX = struct.Struct('<8sII') # magic, version, header size
+
+# arrays of the instance and their dtype in the file
+ARRAYS = {
+    'indptr': '<i8',
+    'indices': '<i4',
+    'costs': '<i4',
+    'risk': '|b1',
+    'support': '<i4',
+    'labels': '<i8',
+}
+
+
+# round up to the next multiple of ALIGNMENT
+def aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+# write the instance in the binary format at the current position of the binary file f, which must be
+# a multiple of ALIGNMENT. The offsets in the header are from that position. Returns the size written.
+def write_instance(f, instance):
+    arrays = {name: np.ascontiguousarray(getattr(instance, name), dtype=dtype) for name, dtype in ARRAYS.items()}
+    header = {
+        'meta': instance.meta,
+        'source': instance.source,
+        'target': instance.target,
+        'num_nodes': instance.num_nodes,
+        'arrays': {},
+    }
+
+    # the offsets depend on the header size, which depends on the offsets: give the offsets
+    # room in the header and lay out the arrays after it until the size settles
+    header_size = 0
+    while True:
+        offset = aligned(PREFIX.size + header_size)
+        for name, array in arrays.items():
+            header['arrays'][name] = {'dtype': ARRAYS[name], 'offset': offset, 'length': len(array)}
+            offset = aligned(offset + array.nbytes)
+        encoded = json.dumps(header).encode('utf-8')
+        if len(encoded) <= header_size:
+            break
+        header_size = len(encoded) + 64
+
+    start = f.tell()
+    f.write(PREFIX.pack(MAGIC, VERSION, header_size))
+    f.write(encoded.ljust(header_size))
+    for name, array in arrays.items():
+        f.seek(start + header['arrays'][name]['offset'])
+        array.tofile(f)
+    # pad to the end of the last array, so the record can be mapped whole
+    f.seek(start + offset)
+    f.truncate()
+    return offset
+
+
+# write the instance to path in the binary format
+def save_instance(instance, path):
+    with open(path, 'wb') as f:
+        write_instance(f, instance)
+    return path
+
+
+# read the header of an instance written at offset of a file
+def read_header(path, offset=0):
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        magic, version, header_size = PREFIX.unpack(f.read(PREFIX.size))
+        if magic != MAGIC:
+            raise Exception(f"{path} is not a TCGRE instance file")
+        if version != VERSION:
+            raise Exception(f"{path} has TCGRE instance format version {version}, only version {VERSION} is supported")
+        return json.loads(f.read(header_size).decode('utf-8'))
+
+
+# load an instance written at offset of a file, its arrays are read-only views of a memory map of the file
+def load_instance(path, offset=0):
+    header = read_header(path, offset)
+    buffer = np.memmap(path, dtype=np.uint8, mode='r', offset=offset)
+    arrays = {}
+    for name, layout in header['arrays'].items():
+        dtype = np.dtype(layout['dtype'])
+        start = layout['offset']
+        arrays[name] = buffer[start:start + layout['length'] * dtype.itemsize].view(dtype)
+    return TCGRE_Instance(arrays['indptr'], arrays['indices'], arrays['costs'], arrays['risk'], arrays['support'],
+                          header['source'], header['target'], arrays['labels'], header['meta'])
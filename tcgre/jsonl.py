@@ -0,0 +1,95 @@
+'''
+JSON Lines text format of TCGRE instances, one instance per line.
+
+Every line is a JSON object with the keys, in this order:
+    format    "tcgre"
+    version   1
+    meta      generator family, parameters and seed
+    source    label of the source node
+    target    label of the target node
+    nodes     labels of the nodes
+    edges     [u, v, cost, support] for every undirected edge, with the node labels,
+              support is the label of the support node of a risk edge and null otherwise
+
+The risk edge cost [cost, (support,)] of the compatible graph becomes the
+cost and support fields of its edge, so it survives the round trip. The writer
+builds each line edge by edge in chunks and the reader parses one line at a
+time, so a corpus never has to fit in memory.
+'''
+import json
+
+import numpy as np
+
+from .instance import TCGRE_Instance
+
+FORMAT = 'tcgre'
+VERSION = 1
+CHUNK_SIZE = 4096 # edges encoded at once
+
+
+# write one instance as a line to a text file
+def write_jsonl_instance(f, instance):
+    labels = instance.labels
+    f.write(json.dumps({'format': FORMAT, 'version': VERSION, 'meta': instance.meta,
+                        'source': int(labels[instance.source]), 'target': int(labels[instance.target])})[:-1])
+    f.write(', "nodes": ')
+    f.write(json.dumps(labels.tolist()))
+
+    f.write(', "edges": [')
+    edges = instance.edges()
+    entries = instance.edge_entries
+    for start in range(0, len(entries), CHUNK_SIZE):
+        chunk = entries[start:start + CHUNK_SIZE]
+        support = np.where(instance.risk[chunk], instance.support[chunk], -1)
+        rows = zip(labels[edges[start:start + CHUNK_SIZE, 0]].tolist(), labels[edges[start:start + CHUNK_SIZE, 1]].tolist(),
+                   instance.costs[chunk].tolist(), support.tolist())
+        if start:
+            f.write(', ')
+        f.write(json.dumps([[u, v, cost, int(labels[s]) if s >= 0 else None] for u, v, cost, s in rows])[1:-1])
+    f.write(']}\n')
+
+
+# write instances, e.g. an iterator of generated instances, to a JSON Lines file one by one.
+# mode='a' appends to an existing file. Returns the number of instances written.
+def write_jsonl(path, instances, mode='w'):
+    count = 0
+    with open(path, mode, encoding='utf-8') as f:
+        for instance in instances:
+            write_jsonl_instance(f, instance)
+            count += 1
+    return count
+
+
+# instance of one line of a JSON Lines file
+def parse_jsonl_instance(line):
+    record = json.loads(line)
+    if record.get('format') != FORMAT:
+        raise Exception("Line is not a TCGRE instance")
+    if record.get('version') != VERSION:
+        raise Exception(f"TCGRE JSON Lines version {record.get('version')} is not supported, only version {VERSION}")
+    labels = np.array(record['nodes'], dtype=np.int64)
+    node_index = {label: i for i, label in enumerate(record['nodes'])}
+    edges = record['edges']
+    first = np.fromiter((node_index[edge[0]] for edge in edges), dtype=np.int64, count=len(edges))
+    second = np.fromiter((node_index[edge[1]] for edge in edges), dtype=np.int64, count=len(edges))
+    costs = np.fromiter((edge[2] for edge in edges), dtype=np.int32, count=len(edges))
+    support = np.fromiter((-1 if edge[3] is None else node_index[edge[3]] for edge in edges), dtype=np.int32, count=len(edges))
+
+    # both directions of every edge, a self-loop once, grouped by node in CSR
+    reverse = first != second
+    rows = np.concatenate((first, second[reverse]))
+    order = np.argsort(rows, kind='stable')
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(labels)))))
+    indices = np.concatenate((second, first[reverse]))[order]
+    costs = np.concatenate((costs, costs[reverse]))[order]
+    support = np.concatenate((support, support[reverse]))[order]
+    return TCGRE_Instance(indptr, indices, costs, support >= 0, support, node_index[record['source']],
+                          node_index[record['target']], labels, record['meta'])
+
+
+# read the instances of a JSON Lines file one line at a time
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield parse_jsonl_instance(line)
@@ -0,0 +1,4 @@
+from .nn_rg_fixed_radius import NearestNeighbor_FixedRadius_Graph_Generator
+from .nn_rg_percentage import NearestNeighbor_Percentage_Graph_Generator
+from .tcgre_nn_rg_fixed_radius import TCGRE_NN_FixedRadius_Graph_Generator
+from .tcgre_nn_rg_percentage import TCGRE_NN_Percentage_Graph_Generator
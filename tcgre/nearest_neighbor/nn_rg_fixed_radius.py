@@ -0,0 +1,63 @@
+import logging
+import networkx as nx
+import numpy as np
+from ..spatial import random_position, fixed_radius_edges, connect_spatial_graph
+
+logger = logging.getLogger(__name__)
+
+# Add nodes to the graph
+def add_nodes(G, positions):
+    G.add_nodes_from((node, {'pos': pos}) for node, pos in enumerate(map(tuple, positions.tolist())))
+    return G
+
+## only add edges closest to each node based on fixed radius
+def add_edges_by_fixed_radius(G, positions, fixed_radius):
+    # Find all the pairs within the fixed radius at once with a KD-tree
+    edges = fixed_radius_edges(positions, fixed_radius)
+    G.add_edges_from(edges.tolist())
+    logger.info("Connected %d pairs of nodes within fixed radius %s", len(edges), fixed_radius)
+    return G
+
+class NearestNeighbor_FixedRadius_Graph_Generator:
+    '''
+    Edges formation: 
+    1. For N nodes, nearest neighbours within P fixed raidus are connected to each node.
+    3. Isolated nodes are connected to their nearest neighbour.
+    4. Isolated graph sub-components are connected by a minimum spanning tree over the components.
+    '''
+    def __init__(self, N, width, height, fixed_radius, seed=None):
+        self.N = N
+        self.G = None # nearest neighbor fixed radius graph
+        
+        self.width = width
+        self.height = height
+        self.fixed_radius = fixed_radius
+        
+        self.positions = None
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
+
+    def create_nearest_neighbor_fixed_radius_graph(self):
+        # Create an empty graph
+        G = nx.Graph()
+
+        # Generate random positions for the nodes
+        positions = random_position(self.width, self.height, self.N, self.rng)
+        self.positions = positions
+
+        # Add nodes to the graph
+        self.G = add_nodes(G, positions)
+        # Add edges based on distance, edges are for nearest neighbors within fixed radius
+        self.G = add_edges_by_fixed_radius(self.G, positions, self.fixed_radius)
+        # Check and connect isolated nodes, then the components if any
+        self.G = connect_spatial_graph(self.G, self.positions)
+
+        return self.G, self.positions
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        # Draw the graph with a grid over the area
+        fig = draw_graph(self.G, 'Nearest Neighbor Fixed Radius Graph', pos=self.positions, area=(self.width, self.height), axis_fontsize=12,
+                         node_size=200, with_labels=True, node_color='skyblue', edge_color='black', font_color='gray')
+        # Save the plot
+        return save_figure(fig, f"./tcgre/nearest_neighbor/plots/nearest_neighbor_graph:N{self.N}_{self.fixed_radius}FR.png")
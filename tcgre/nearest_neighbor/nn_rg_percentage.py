@@ -0,0 +1,71 @@
+import logging
+import networkx as nx
+import numpy as np
+from ..spatial import random_position, knn_edges, connect_spatial_graph
+
+logger = logging.getLogger(__name__)
+
+# Add nodes to the graph
+def add_nodes(G, positions):
+    G.add_nodes_from((node, {'pos': pos}) for node, pos in enumerate(map(tuple, positions.tolist())))
+    return G
+
+## only add edges closest to each node based on a percentage
+def add_edges_by_distance(G, positions, percentage, mutual=False):
+    n = len(positions)
+    # Determine the number of closest nodes to connect based on the percentage
+    num_neighbors = int(np.ceil(percentage / 100.0 * (n - 1)))
+    logger.debug("num_neighbors: %d", num_neighbors)
+
+    # Connect to the closest 'num_neighbors' nodes, found for all nodes at once with a KD-tree
+    # mutual: only connect two nodes if each one is among the closest nodes of the other
+    edges = knn_edges(positions, num_neighbors, mutual=mutual)
+    G.add_edges_from(edges.tolist())
+    return G
+
+class NearestNeighbor_Percentage_Graph_Generator:
+    '''
+    Edges formation: 
+    1. For N nodes, P% of the nearest neighbours are connected to each node.
+    2. With mutual=True, two nodes are only connected if each is among the P% nearest neighbours of the other.
+    3. Isolated nodes are connected to their nearest neighbour.
+    4. Isolated graph sub-components are connected by a minimum spanning tree over the components.
+    '''
+    def __init__(self, N, P, width, height, mutual=False, seed=None):
+        self.N = N
+        self.P = P
+        self.mutual = mutual # mutual instead of symmetric nearest neighbours
+        self.G = None
+
+        self.width = width
+        self.height = height
+
+        self.positions = None
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
+
+    def create_nearest_neighbor_percentage_graph(self):
+        # Create an empty graph
+        G = nx.Graph()
+
+        # Generate random positions for the nodes
+        self.positions = random_position(self.width, self.height, self.N, self.rng)
+
+        # Add nodes to the graph
+        self.G = add_nodes(G, self.positions)
+
+        # Add edges based on distance, connecting P% of the nearest neighbors
+        self.G = add_edges_by_distance(self.G, self.positions, self.P, self.mutual)
+
+        # Check and connect isolated nodes, then the components if any
+        self.G = connect_spatial_graph(self.G, self.positions)
+
+        return self.G, self.positions
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        # Draw the graph with a grid over the area
+        fig = draw_graph(self.G, 'Nearest Neighbor Percentage Graph', pos=self.positions, area=(self.width, self.height),
+                         node_size=150, with_labels=True, node_color='skyblue', edge_color='gray')
+        # Save the plot
+        return save_figure(fig, f'./tcgre/nearest_neighbor/plots/nearest_neighbor_graph:N{self.N}_{self.P}P.png')
@@ -0,0 +1,57 @@
+import logging
+from ..base import TCGRE_Graph_Generator
+from ..registry import register_generator
+from .nn_rg_fixed_radius import NearestNeighbor_FixedRadius_Graph_Generator
+
+logger = logging.getLogger(__name__)
+
+@register_generator('nearest_neighbor_fixed_radius')
+class TCGRE_NN_FixedRadius_Graph_Generator(TCGRE_Graph_Generator):
+    def __init__(self, N, fixed_radius, width, height, risk_edge_ratio, risk_cost=20, normal_cost_range=(1, 10), seed=None):
+        super().__init__(risk_edge_ratio, seed, risk_cost, normal_cost_range)
+        self.N = N
+        self.positions = None
+
+        self.width = width
+        self.height = height
+        self.fixed_radius = fixed_radius
+
+
+    def create_nn_fixed_radius_graph(self):
+        # Create a graph with N nodes
+        G = NearestNeighbor_FixedRadius_Graph_Generator(self.N, self.width, self.height, self.fixed_radius, seed=self.rng)
+        self.TCGRE_G, self.positions = G.create_nearest_neighbor_fixed_radius_graph()
+        logger.info("Nearest Neighbor Graph created: %d nodes, %d edges", self.TCGRE_G.number_of_nodes(), self.TCGRE_G.number_of_edges())
+        return self.TCGRE_G
+
+    def create_graph(self):
+        return self.create_nn_fixed_radius_graph()
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        edge_labels = {(u, v): d['cost'] for u, v, d in self.TCGRE_G.edges(data=True)}
+        # Draw the graph with a grid over the area
+        fig = draw_graph(self.TCGRE_G, f"TCGRE Nearest Neighbor Graph with Fixed Radius", pos=self.positions, edge_labels=edge_labels,
+                         risk_edges=self.risk_edges.keys(), risk_edge_color='red', area=(self.width, self.height), axis_fontsize=12,
+                         node_size=500, with_labels=True, node_color='skyblue', edge_color='black', font_color='w')
+        # Save the plot
+        return save_figure(fig, f"./tcgre/nearest_neighbor/plots/tcgre_nearest_neighbor_graph:N{self.N}_{int(self.fixed_radius)}FR.png")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    ## Number of nodes
+    N = 20
+    # Area dimensions
+    width, height = N, N
+    # fixed radius for nearest neighbors
+    fixed_radius = N/3
+    risk_edge_ratio = 0.2
+
+    tcgre_nn_fixed_radius = TCGRE_NN_FixedRadius_Graph_Generator(N, fixed_radius, width, height, risk_edge_ratio)
+    tcgre_nn_fixed_radius.create_nn_fixed_radius_graph()
+    tcgre_nn_fixed_radius.pick_risk_edges_and_support_nodes()
+    tcgre_nn_fixed_radius.add_cost_to_edges()
+    # tcgre_nn_fixed_radius.plot_graph() # plot the graph
+    graph_info_tcgre_nn_fixed_radius = tcgre_nn_fixed_radius.convert_to_compatible_graph()
+    print(f"Graph Info: {graph_info_tcgre_nn_fixed_radius}")
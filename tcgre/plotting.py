@@ -0,0 +1,65 @@
+'''
+Rendering of the generated graphs.
+
+This module is only imported by the plot methods of the generators, so importing
+a generator does not load matplotlib. Rendering is headless: the Agg backend is
+used and every figure is saved to a file and closed.
+'''
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import networkx as nx
+
+
+# draw a graph, optionally with edge labels, red risk edges and a grid over the area
+def draw_graph(G, title, pos=None, layout_seed=None, figsize=None, edge_labels=None, edge_label_color=None,
+               risk_edges=None, risk_edge_color='r', area=None, axis_fontsize=None, **draw_kwargs):
+    fig = plt.figure(figsize=figsize)
+    if pos is None:
+        pos = nx.spring_layout(G, seed=layout_seed)
+    nx.draw(G, pos, **draw_kwargs)
+    # Draw the edge labels
+    if edge_labels is not None:
+        label_kwargs = {'font_color': edge_label_color} if edge_label_color else {}
+        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, **label_kwargs)
+    # color red for risk edges
+    if risk_edges is not None:
+        nx.draw_networkx_edges(G, pos, edgelist=list(risk_edges), edge_color=risk_edge_color, width=1.0)
+
+    # Configure and show grid over the area of the nodes
+    if area is not None:
+        width, height = area
+        plt.grid(True, which='both', color='gray', linewidth=0.8, linestyle='--')  # Ensuring the grid is visible
+        plt.axhline(y=0, color='k')
+        plt.axvline(x=0, color='k')
+        plt.axis('on')  # Ensure the axis is shown
+        plt.xlabel('Width', fontsize=axis_fontsize)
+        plt.ylabel('Height', fontsize=axis_fontsize)
+        plt.xticks(range(0, width))  # Set ticks for x-axis
+        plt.yticks(range(0, height))  # Set ticks for y-axis
+
+    plt.title(title)
+    return fig
+
+
+# draw a voronoi diagram with the graph of its neighbouring points on top
+def draw_voronoi_graph(vor, G, points):
+    from scipy.spatial import voronoi_plot_2d
+
+    fig, ax = plt.subplots()
+    voronoi_plot_2d(vor, ax=ax, show_vertices=False, line_colors='orange', line_width=2, line_alpha=0.6, point_size=2)
+    pos = {i: point for i, point in enumerate(points)}
+    nx.draw(G, pos, ax=ax, node_color='skyblue', node_size=200, with_labels=True, edge_color='gray', font_size=10)
+    return fig
+
+
+# release the memory of a figure
+def close_figure(fig):
+    plt.close(fig)
+
+
+# save the figure and release its memory
+def save_figure(fig, path):
+    fig.savefig(path)
+    close_figure(fig)
+    return path
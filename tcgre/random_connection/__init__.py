@@ -0,0 +1,2 @@
+from .rc_rg_generator import RandomConnection_Graph_Generator
+from .rc_tcgre_rg_generator import TCGRE_RC_Graph_Generator
@@ -0,0 +1,103 @@
+import logging
+import numpy as np
+import networkx as nx
+from networkx.utils import UnionFind
+from ..sampling import geometric_skip_pairs, pair_index_to_edges, random_bridges
+
+logger = logging.getLogger(__name__)
+
+class RandomConnection_Graph_Generator:
+    '''
+    Edges formation:
+    1. Every pair of vertices is connected with probability density, every vertex has a self-loop
+       with probability density if self_loops is True.
+    2. sparse=False builds the dense VxV adjacency matrix, sparse=True samples the edges directly:
+       only the kept vertex pairs by their geometric gaps, in O(V + E) time and memory at any density.
+    3. Components are connected to make the graph connected, the added bridges are kept in self.bridges.
+    '''
+    def __init__(self, num_vertices, density=0.5, self_loops=True, sparse=False, seed=None):
+        self.V = num_vertices  # number of vertices
+        self.density = density # probability of an edge between two vertices
+        self.self_loops = self_loops # allow self-loops
+        self.sparse = sparse # sample the edges directly instead of the dense matrix
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
+        self.adjacency_matrix_list = None
+        self.edges = None # (E, 2) edge array of the sparse mode
+        self.bridges = None # edges added to connect the components
+        self.G = None
+
+    def create_graph_from_adjacency_matrix(self):
+        if self.sparse:
+            self.edges = self.generate_sparse_edges()
+            self.G = nx.Graph()
+            self.G.add_nodes_from(range(self.V))
+            self.G.add_edges_from(self.edges.tolist())
+            self.bridges = self.ensure_connected()
+            return self.G
+
+        if self.self_loops:
+            self.adjacency_matrix_list = self.generate_adjacency_matrix()
+        else:
+            # withou loops
+            self.adjacency_matrix_list = self.generate_adjacency_matrix_without_self_loops()
+        self.G = nx.from_numpy_array(np.array(self.adjacency_matrix_list))
+        self.bridges = self.ensure_connected()
+        return self.G
+    
+    
+    def generate_adjacency_matrix(self):
+        # Generate a random binary matrix where each element is 1 with probability density.
+        # This matrix is of size VxV and is initially not symmetrical.
+        binary_matrix = (self.rng.random((self.V, self.V)) < self.density).astype(int)
+        
+        # Create a lower triangular matrix from the random matrix. This includes the diagonal.
+        lower_triangular = np.tril(binary_matrix)
+        
+        # Create the symmetric adjacency matrix by adding the lower triangular matrix to its transpose.
+        # This ensures the matrix is symmetric, representing an undirected graph.
+        adjacency_matrix_symmetric = lower_triangular + np.tril(binary_matrix, -1).T
+        
+        # Convert the symmetric numpy matrix to a list of lists for easier handling in other functions or systems that might not use numpy.
+        adjacency_matrix_list = adjacency_matrix_symmetric.tolist()
+        # print("Adjacency matrix:", self.adjacency_matrix_list)
+        return adjacency_matrix_list
+
+    # sample the edges without the VxV matrix, as an (E, 2) int64 array with i <= j
+    def generate_sparse_edges(self):
+        # pairs of distinct vertices kept with probability density, drawn by the gaps between them
+        pair_index = geometric_skip_pairs(self.V, self.density, self.rng)
+        edges = pair_index_to_edges(pair_index)
+
+        if self.self_loops:
+            loops = np.flatnonzero(self.rng.random(self.V) < self.density)
+            edges = np.concatenate((np.column_stack((loops, loops)), edges))
+        return edges
+    
+    def generate_adjacency_matrix_without_self_loops(self):
+        adjacency_matrix = self.generate_adjacency_matrix()
+        # Remove self-loops from the adjacency matrix
+        for i in range(self.V):
+            adjacency_matrix[i][i] = 0
+        return adjacency_matrix
+    
+    # connect all the components in one pass, returns the list of added bridge edges
+    def ensure_connected(self):
+        # Find all the components once with a disjoint-set over the edges
+        components = UnionFind(self.G.nodes())
+        for u, v in self.G.edges():
+            components.union(u, v)
+        components = [list(component) for component in components.to_sets()]
+
+        bridges = random_bridges(components, self.rng)
+        if bridges:
+            self.G.add_edges_from(bridges)
+            logger.info("Connected %d components with %d bridges", len(components), len(bridges))
+        else:
+            logger.info("Graph is connected")
+        return bridges
+    
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        fig = draw_graph(self.G, "Random Connection Graph", with_labels=True, edge_color='gray', node_color='skyblue', node_size=500, font_size=15, font_color='w')
+        # Save the plot
+        return save_figure(fig, f"./tcgre/random_connection/plots/random_connection_graph_N{self.V}.png")
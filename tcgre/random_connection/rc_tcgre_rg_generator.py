@@ -0,0 +1,49 @@
+import logging
+import networkx as nx
+from ..base import TCGRE_Graph_Generator
+from ..registry import register_generator
+from .rc_rg_generator import RandomConnection_Graph_Generator
+
+logger = logging.getLogger(__name__)
+
+@register_generator('random_connection')
+class TCGRE_RC_Graph_Generator(TCGRE_Graph_Generator):
+    def __init__(self, N, risk_edge_ratio, density=0.5, self_loops=True, sparse=False, risk_cost=20, normal_cost_range=(1, 10), seed=None):
+        super().__init__(risk_edge_ratio, seed, risk_cost, normal_cost_range)
+        self.N = N
+        self.density = density # probability of an edge between two vertices
+        self.self_loops = self_loops # allow self-loops
+        self.sparse = sparse # sample the edges directly instead of the dense matrix
+        self.bridges = None
+
+    def create_random_connection_graph(self):
+        G = RandomConnection_Graph_Generator(self.N, self.density, self.self_loops, self.sparse, seed=self.rng)
+        self.TCGRE_G = G.create_graph_from_adjacency_matrix()
+        self.bridges = G.bridges # edges added to connect the components
+        logger.info("Random Connection Graph created: %d nodes, %d edges", self.TCGRE_G.number_of_nodes(), self.TCGRE_G.number_of_edges())
+        return self.TCGRE_G
+
+    def create_graph(self):
+        return self.create_random_connection_graph()
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        edge_labels = nx.get_edge_attributes(self.TCGRE_G, 'cost')
+        fig = draw_graph(self.TCGRE_G, "TCGRE Random Connection Graph", edge_labels=edge_labels, edge_label_color='black', risk_edges=self.risk_edges.keys(),
+                         with_labels=True, node_size=500, node_color='skyblue', font_color='w', edge_color='gray')
+        # Save the plot
+        return save_figure(fig, f"./tcgre/random_connection/plots/tcgre_random_connection_graph_N{self.N}.png")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    # # Example usage
+    N = 10 # Number of nodes
+    risk_edge_ratio = 0.2
+    tcgre_rc = TCGRE_RC_Graph_Generator(N, risk_edge_ratio)
+    tcgre_rc.create_random_connection_graph()
+    tcgre_rc.pick_risk_edges_and_support_nodes()
+    tcgre_rc.add_cost_to_edges()
+    # tcgre_rc.plot_graph() # plot the graph
+    graph_info_tcgre_rc = tcgre_rc.convert_to_compatible_graph()
+    print(f"Graph Info: {graph_info_tcgre_rc}")
@@ -0,0 +1,26 @@
+# name -> TCGRE generator class, filled by the register_generator decorator
+GENERATORS = {}
+
+
+# register a TCGRE generator class under a family name
+def register_generator(name):
+    def decorator(cls):
+        cls.name = name
+        GENERATORS[name] = cls
+        return cls
+    return decorator
+
+
+# get the TCGRE generator class registered under a family name
+def get_generator(name):
+    try:
+        return GENERATORS[name]
+    except KeyError:
+        raise KeyError(f"Unknown generator '{name}', available generators: {sorted(GENERATORS)}") from None
+
+
+# create a TCGRE generator instance of a family with its parameters, which it keeps in params
+def create_generator(name, **params):
+    tcgre_gen = get_generator(name)(**params)
+    tcgre_gen.params = {key: value for key, value in params.items() if key != 'seed'}
+    return tcgre_gen
@@ -0,0 +1,64 @@
+'''
+Sampling of random vertex pairs without looking at all the n(n-1)/2 pairs.
+
+The pairs (j, i), j < i, of n vertices are numbered in the order
+(0, 1), (0, 2), (1, 2), (0, 3), ... so pair (j, i) has index i*(i-1)/2 + j.
+The pair indices are int64, enough for n up to about 4*10^9.
+'''
+import numpy as np
+
+
+# number of pairs of n vertices
+def num_pairs(n):
+    return n * (n - 1) // 2
+
+
+# pairs of the pair indices as an (E, 2) int64 array with j < i in every row
+def pair_index_to_edges(pair_index):
+    pair_index = np.asarray(pair_index, dtype=np.int64)
+    i = np.floor((1 + np.sqrt(1 + 8 * pair_index.astype(float))) / 2).astype(np.int64)
+    # correct the rounding of the square root for large indices
+    i -= i * (i - 1) // 2 > pair_index
+    i += (i + 1) * i // 2 <= pair_index
+    j = pair_index - i * (i - 1) // 2
+    return np.column_stack((j, i))
+
+
+# sorted indices of the pairs of n vertices kept independently with probability p.
+# The gaps between kept pairs are geometric, so only the kept pairs are drawn, in O(n + m).
+def geometric_skip_pairs(n, p, seed=None):
+    rng = np.random.default_rng(seed)
+    total = num_pairs(n)
+    if p <= 0 or total == 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+
+    chunks = []
+    last = -1 # index of the last kept pair
+    while last < total:
+        # draw the gaps of the expected remaining number of pairs and a margin in one call
+        expected = (total - last) * p
+        size = int(expected + 4 * np.sqrt(expected)) + 16
+        kept = last + np.cumsum(rng.geometric(p, size=size), dtype=np.int64)
+        chunks.append(kept)
+        last = kept[-1]
+    kept = np.concatenate(chunks)
+    return kept[:np.searchsorted(kept, total)]
+
+
+# edges joining the components (lists of nodes) into one, as a list of (u, v) tuples. The components
+# are linked in a random order, each one to a random member of a component linked before it,
+# so there are exactly len(components) - 1 bridges.
+def random_bridges(components, seed=None):
+    rng = np.random.default_rng(seed)
+    bridges = []
+    if len(components) > 1:
+        order = rng.permutation(len(components))
+        for k in range(1, len(order)):
+            component = components[order[k]]
+            linked_component = components[order[rng.integers(k)]]
+            connect_from = component[rng.integers(len(component))]
+            connect_to = linked_component[rng.integers(len(linked_component))]
+            bridges.append((connect_from, connect_to))
+    return bridges
@@ -0,0 +1,227 @@
+'''
+Spatial index helpers shared by the geometric generators.
+
+Positions are the points of the nodes as an (N, 2) array, node i is at row i.
+A {node: (x, y)} dict with the nodes 0..N-1 is accepted as well.
+'''
+import logging
+import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import minimum_spanning_tree
+from scipy.spatial import cKDTree, Delaunay, Voronoi, QhullError
+
+logger = logging.getLogger(__name__)
+
+
+# Generate N distinct random integer positions 1 <= x <= width-1, 1 <= y <= height-1 as an (N, 2) array.
+# Distinct cells of the flattened lattice are sampled without replacement in one call.
+def random_position(width, height, N, seed=None):
+    rng = np.random.default_rng(seed)
+    cols, rows = width - 1, height - 1
+    num_cells = max(cols, 0) * max(rows, 0)
+    if N > num_cells:
+        raise Exception(f"Cannot place {N} nodes on distinct positions, the {width}x{height} area only has {num_cells} positions")
+    cells = rng.choice(num_cells, size=N, replace=False)
+    return np.column_stack((cells % cols + 1, cells // cols + 1))
+
+
+# positions of the nodes 0..N-1 as an (N, 2) float array
+def as_points(positions):
+    if isinstance(positions, dict):
+        positions = [positions[node] for node in range(len(positions))]
+    return np.asarray(positions, dtype=float).reshape(-1, 2)
+
+
+# all pairs (i, j), i < j, closer than radius, as an (E, 2) int array
+def fixed_radius_edges(positions, radius):
+    points = as_points(positions)
+    tree = cKDTree(points)
+    pairs = tree.query_pairs(radius, output_type='ndarray')
+    # query_pairs includes pairs at exactly radius, the edges are strictly closer
+    distances = np.linalg.norm(points[pairs[:, 0]] - points[pairs[:, 1]], axis=1)
+    edges = pairs[distances < radius]
+    # sort the edges so the same positions always give the same edge order
+    return edges[np.lexsort((edges[:, 1], edges[:, 0]))]
+
+
+# indices of the k nearest neighbours of every node as an (N, k) int array, closest first.
+# Ties on distance are broken by the smaller node index. Positions must be distinct.
+def knn_indices(positions, k, tie_margin=8):
+    points = as_points(positions)
+    n = len(points)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.intp)
+    tree = cKDTree(points)
+    # query a few more neighbours than needed so ties at the k-th distance can be ordered by index
+    num_query = min(k + 1 + tie_margin, n)
+    distances, indices = tree.query(points, k=num_query)
+
+    # drop the node itself, the only point at distance 0
+    not_self = indices != np.arange(n)[:, None]
+    distances = distances[not_self].reshape(n, num_query - 1)
+    indices = indices[not_self].reshape(n, num_query - 1)
+    order = np.lexsort((indices, distances), axis=-1)
+    distances = np.take_along_axis(distances, order, axis=-1)
+    indices = np.take_along_axis(indices, order, axis=-1)
+
+    # rows where the ties at the k-th distance may go past the queried neighbours are redone exactly
+    if num_query < n:
+        for node in np.flatnonzero(distances[:, k - 1] == distances[:, -1]):
+            ball = np.array([j for j in tree.query_ball_point(points[node], distances[node, k - 1] * (1 + 1e-9)) if j != node])
+            ball_distances = np.linalg.norm(points[ball] - points[node], axis=1)
+            indices[node, :k] = ball[np.lexsort((ball, ball_distances))][:k]
+    return indices[:, :k]
+
+
+# edges between every node and its k nearest neighbours as an (E, 2) int array with i < j.
+# symmetric kNN keeps an edge chosen by either node, mutual kNN only an edge chosen by both.
+def knn_edges(positions, k, mutual=False):
+    neighbors = knn_indices(positions, k)
+    n, k = neighbors.shape
+    # an edge chosen by both nodes appears twice
+    keys = pair_keys(np.repeat(np.arange(n), k), neighbors.ravel(), n)
+    keys, counts = np.unique(keys, return_counts=True)
+    if mutual:
+        keys = keys[counts == 2]
+    return keys_to_edges(keys, n)
+
+
+# edges from every isolated node to its nearest non-isolated node as an (I, 2) int array,
+# found with a single KD-tree query over the non-isolated points
+def isolate_bridges(positions, isolates):
+    points = as_points(positions)
+    isolates = np.asarray(isolates, dtype=np.intp)
+    others = np.setdiff1d(np.arange(len(points)), isolates)
+    if len(isolates) == 0 or len(others) == 0:
+        return np.empty((0, 2), dtype=np.intp)
+    _, nearest = cKDTree(points[others]).query(points[isolates])
+    return np.column_stack((isolates, others[nearest]))
+
+
+# connect every isolated node of G to its nearest non-isolated node, returns the added edges
+def connect_isolated_nodes(G, positions):
+    isolates = list(nx.isolates(G))
+    bridges = isolate_bridges(positions, isolates)
+    G.add_edges_from(bridges.tolist())
+    return bridges
+
+
+# one int64 key per undirected pair (i, j), with n the number of points
+def pair_keys(first, second, n):
+    first = np.asarray(first, dtype=np.int64)
+    second = np.asarray(second, dtype=np.int64)
+    return np.minimum(first, second) * n + np.maximum(first, second)
+
+
+# (E, 2) int32 edge array of sorted unique pair keys
+def keys_to_edges(keys, n):
+    return np.column_stack((keys // n, keys % n)).astype(np.int32)
+
+
+# edges between the points with neighbouring Voronoi regions when Qhull cannot build the diagram, less than
+# 3 points or all points on a line: consecutive points along the line. All their ridges are unbounded.
+def collinear_edges(points, drop_unbounded=False):
+    n = len(points)
+    if drop_unbounded:
+        return np.empty((0, 2), dtype=np.int32)
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    return keys_to_edges(np.sort(pair_keys(order[:-1], order[1:], n)), n)
+
+
+# edges of the Delaunay triangulation as an (E, 2) int32 array with i < j, these are the pairs of
+# points with neighbouring Voronoi regions. For any split of the points into two sides, the closest
+# pair across the split is one of them. drop_hull drops the convex hull edges, whose Voronoi ridges
+# are unbounded.
+def delaunay_edges(positions, drop_hull=False):
+    points = as_points(positions)
+    n = len(points)
+    try:
+        tri = Delaunay(points)
+    except (QhullError, ValueError):
+        return collinear_edges(points, drop_hull)
+    simplices = tri.simplices
+    # the edges shared by two triangles appear twice
+    keys = np.unique(pair_keys(np.concatenate((simplices[:, 0], simplices[:, 1], simplices[:, 0])),
+                               np.concatenate((simplices[:, 1], simplices[:, 2], simplices[:, 2])), n))
+    if drop_hull:
+        keys = keys[~np.isin(keys, pair_keys(tri.convex_hull[:, 0], tri.convex_hull[:, 1], n))]
+    return keys_to_edges(keys, n)
+
+
+# edges between the points with neighbouring Voronoi regions from the ridges of the full
+# Voronoi diagram, as an (E, 2) int32 array with i < j. drop_unbounded drops the ridges
+# going to infinity.
+def voronoi_ridge_edges(positions, drop_unbounded=False):
+    points = as_points(positions)
+    try:
+        vor = Voronoi(points)
+    except (QhullError, ValueError):
+        return collinear_edges(points, drop_unbounded)
+    ridge_points = vor.ridge_points
+    if drop_unbounded:
+        # -1 is the vertex at infinity
+        ridge_points = ridge_points[(np.asarray(vor.ridge_vertices) >= 0).all(axis=1)]
+    keys = np.unique(pair_keys(ridge_points[:, 0], ridge_points[:, 1], len(points)))
+    return keys_to_edges(keys, len(points))
+
+
+# bridges joining all the components, labels[i] is the component of node i (0..k-1).
+# The bridges form a minimum spanning tree over the components, where the distance between
+# two components is their closest pair of points, and every bridge is such a closest pair.
+def component_bridges(positions, labels):
+    points = as_points(positions)
+    labels = np.asarray(labels)
+    num_components = int(labels.max()) + 1 if len(labels) else 0
+    if num_components <= 1:
+        return np.empty((0, 2), dtype=np.intp)
+
+    # only the candidate pairs between different components
+    pairs = delaunay_edges(points)
+    pairs = pairs[labels[pairs[:, 0]] != labels[pairs[:, 1]]]
+    lengths = np.linalg.norm(points[pairs[:, 0]] - points[pairs[:, 1]], axis=1)
+
+    # keep the shortest pair for every pair of components
+    low = np.minimum(labels[pairs[:, 0]], labels[pairs[:, 1]]).astype(np.int64)
+    high = np.maximum(labels[pairs[:, 0]], labels[pairs[:, 1]]).astype(np.int64)
+    order = np.lexsort((lengths, low * num_components + high))
+    keys = (low * num_components + high)[order]
+    first = np.concatenate(([True], keys[1:] != keys[:-1]))
+    shortest = order[first]
+
+    # minimum spanning tree of the components, the distances are positive as the points are distinct
+    component_graph = coo_matrix((lengths[shortest], (low[shortest], high[shortest])), shape=(num_components, num_components))
+    tree = minimum_spanning_tree(component_graph).tocoo()
+    tree_keys = np.minimum(tree.row, tree.col).astype(np.int64) * num_components + np.maximum(tree.row, tree.col)
+    # keys[first] is sorted, so the bridge of every tree edge is found by binary search
+    bridges = shortest[np.searchsorted(keys[first], tree_keys)]
+    return pairs[np.sort(bridges)]
+
+
+# make G, the graph of the nodes 0..N-1 at positions, connected: every isolated node is connected to its
+# nearest node that is not isolated, then the components by a minimum spanning tree over the components
+def connect_spatial_graph(G, positions):
+    # connect every isolated node to its nearest neighbor not isolated
+    bridges = connect_isolated_nodes(G, positions)
+    if len(bridges):
+        logger.info("Connected %d isolated nodes to their nearest neighbors", len(bridges))
+        logger.debug("Isolated nodes: %s", bridges[:, 0])
+    else:
+        logger.info("No isolated nodes detected.")
+
+    # Find all connected components
+    components = list(nx.connected_components(G))
+    if len(components) > 1:
+        logger.info("Graph is not fully connected; it has %d components.", len(components))
+        # Join the components with a minimum spanning tree over the components,
+        # each component is connected by the shortest bridge to the part it joins
+        labels = np.empty(G.number_of_nodes(), dtype=np.intp)
+        for label, component in enumerate(components):
+            labels[list(component)] = label
+        bridges = component_bridges(positions, labels)
+        G.add_edges_from(bridges.tolist())
+        logger.info("Connected %d bridges to unify components.", len(bridges))
+    else:
+        logger.info("Graph is fully connected.")
+    return G
@@ -0,0 +1,2 @@
+from .vd_rg import VoronoiDiagram_Graph_Generator
+from .vd_tcgre_rg_generator import TCGRE_VD_Graph_Generator
@@ -0,0 +1,58 @@
+import logging
+import networkx as nx
+import numpy as np
+from scipy.spatial import Voronoi
+from ..spatial import delaunay_edges, voronoi_ridge_edges, connect_spatial_graph
+
+logger = logging.getLogger(__name__)
+
+class VoronoiDiagram_Graph_Generator:
+    '''
+    Edges formation:
+    1. N random points in the unit square, two points are connected when their voronoi regions share a ridge.
+    2. method='delaunay' takes these pairs from the delaunay triangulation, method='voronoi' from the ridges of the full voronoi diagram.
+    3. drop_unbounded=True drops the ridges going to infinity (the convex hull edges of the points).
+    4. Isolated nodes are connected to their nearest neighbour, and the components left when drop_unbounded drops
+       all the ridges of some points are joined by a minimum spanning tree over the components.
+    '''
+    def __init__(self, num_points, method='delaunay', drop_unbounded=False, seed=None):
+        self.N = num_points
+        self.method = method
+        self.drop_unbounded = drop_unbounded
+        self.rng = np.random.default_rng(seed) # random number generator, a seed or a numpy Generator
+        self.G = None
+        self.points = None
+        self.edges = None # (E, 2) int32 edge array of the voronoi neighbours
+
+    def create_voronoi_graph(self):
+        self.G, self.points = self.generate_voronoi_graph()
+        # connect the isolated nodes, then the components if any
+        self.G = connect_spatial_graph(self.G, self.points)
+        logger.info("Voronoi graph: %d nodes, %d edges", self.G.number_of_nodes(), self.G.number_of_edges())
+
+        return self.G, self.points
+
+
+    def generate_voronoi_graph(self):
+        points = self.rng.random((self.N, 2))
+        # points are connected when their voronoi regions share a ridge
+        if self.method == 'delaunay':
+            # same neighbours from the delaunay triangulation, without building the voronoi vertices
+            self.edges = delaunay_edges(points, drop_hull=self.drop_unbounded)
+        elif self.method == 'voronoi':
+            self.edges = voronoi_ridge_edges(points, drop_unbounded=self.drop_unbounded)
+        else:
+            raise Exception(f"Unknown method '{self.method}', use 'delaunay' or 'voronoi'")
+
+        G = nx.Graph()
+        G.add_nodes_from(range(self.N))
+        G.add_edges_from(self.edges.tolist())
+        return G, points
+
+    # plot the voronoi diagram with the graph, rendering is only done when asked for
+    def plot_graph(self):
+        from ..plotting import draw_voronoi_graph, save_figure
+        # the diagram is rebuilt from the points so generation does not keep it in memory
+        fig = draw_voronoi_graph(Voronoi(self.points), self.G, self.points)
+        # Save the plot
+        return save_figure(fig, f'./tcgre/voronoi_diagram/plots/voronoi_graph_N{self.N}.png')
@@ -0,0 +1,46 @@
+import logging
+import networkx as nx
+from ..base import TCGRE_Graph_Generator
+from ..registry import register_generator
+from .vd_rg import VoronoiDiagram_Graph_Generator
+
+logger = logging.getLogger(__name__)
+
+@register_generator('voronoi_diagram')
+class TCGRE_VD_Graph_Generator(TCGRE_Graph_Generator):
+    def __init__(self, num_points, risk_edge_ratio, method='delaunay', drop_unbounded=False, risk_cost=20, normal_cost_range=(1, 10), seed=None):
+        super().__init__(risk_edge_ratio, seed, risk_cost, normal_cost_range)
+        self.N = num_points
+        self.method = method # 'delaunay' or 'voronoi'
+        self.drop_unbounded = drop_unbounded # drop the ridges going to infinity
+        self.points = None
+
+    def create_voronoi_graph(self):
+        self.TCGRE_G, self.points = VoronoiDiagram_Graph_Generator(self.N, self.method, self.drop_unbounded, seed=self.rng).create_voronoi_graph()
+        logger.info("Voronoi Diagram Graph created: %d nodes, %d edges", self.TCGRE_G.number_of_nodes(), self.TCGRE_G.number_of_edges())
+        return self.TCGRE_G, self.points
+
+    def create_graph(self):
+        return self.create_voronoi_graph()
+
+    # plot the graph
+    def plot_graph(self):
+        from ..plotting import draw_graph, save_figure
+        edge_labels = nx.get_edge_attributes(self.TCGRE_G, 'cost')
+        fig = draw_graph(self.TCGRE_G, "TCGRE Random Connection Graph", edge_labels=edge_labels, edge_label_color='black', risk_edges=self.risk_edges.keys(),
+                         with_labels=True, node_size=500, node_color='skyblue', font_color='w', edge_color='gray')
+        # Save the plot
+        return save_figure(fig, f"./tcgre/voronoi_diagram/plots/tcgre_voronoi_graph_N{self.N}.png")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    # Example usage
+    N = 10 # Number of points/nodes
+    risk_edge_ratio = 0.2
+    tcgre_vd_graph = TCGRE_VD_Graph_Generator(N, risk_edge_ratio)
+    tcgre_vd_graph.create_voronoi_graph()
+    tcgre_vd_graph.pick_risk_edges_and_support_nodes()
+    tcgre_vd_graph.add_cost_to_edges()
+    # tcgre_vd_graph.plot_graph() # plot the graph
+    graph_info_tcgre_vd = tcgre_vd_graph.convert_to_compatible_graph()
+    print(f"Graph Info: {graph_info_tcgre_vd}")